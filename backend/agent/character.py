@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
-
-from agents import Agent, Runner, function_tool, SQLiteSession
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 from ..memory.manager import retrieve_texts, save_long_fact
 
+if TYPE_CHECKING:
+    from agents import Agent, FunctionTool
+
+# NOTE: Agents SDK（およびそれが引き込む openai）は import が重いため、
+# モジュール読み込み時ではなく初回利用時（またはウォームアップ時）に読み込む。
+
 
 BASE_INSTRUCTIONS = (
     "あなたは丁寧で親しみやすい一般的な女性キャラクターです。"
@@ -15,28 +20,42 @@ BASE_INSTRUCTIONS = (
 )
 
 
-@function_tool
 def retrieve_memories(query: Optional[str] = None, days: Optional[int] = 14) -> str:
     """短期/長期メモリから関連テキストを収集して返します。"""
     return retrieve_texts(query=query, days=days or 14)
 
 
-@function_tool
 def save_long_term_memory(text: str, category: Optional[str] = None) -> str:
     """重要/反復/印象的な事項を極小要約として long-term.md に追記します。"""
     return save_long_fact(text=text, category=category)
 
 
+@lru_cache(maxsize=1)
+def _tools() -> tuple[FunctionTool, FunctionTool]:
+    from agents import function_tool
+
+    return (function_tool(retrieve_memories), function_tool(save_long_term_memory))
+
+
+def warm_up() -> None:
+    """Import the Agents SDK and build the tool schemas ahead of the first request."""
+    _tools()
+
+
 def build_agent(model: Optional[str] = None, instructions: Optional[str] = None) -> Agent:
+    from agents import Agent
+
     return Agent(
         name="Assistant",
         instructions=instructions or BASE_INSTRUCTIONS,
         model=model or os.getenv("OPENAI_MODEL", "gpt-5-mini"),
-        tools=[retrieve_memories, save_long_term_memory],
+        tools=list(_tools()),
     )
 
 
 async def run_turn(user_text: str, session_id: str = "default", model: Optional[str] = None, instructions: Optional[str] = None) -> str:
+    from agents import Runner, SQLiteSession
+
     agent = build_agent(model=model, instructions=instructions)
     session = SQLiteSession(session_id)
     result = await Runner.run(agent, user_text, session=session)
@@ -50,6 +69,8 @@ async def prepare_context(user_text: str, session_id: str = "default", days: int
     `retrieve_memories` if helpful, then return a single line starting with
     'CONTEXT:' followed by concise memory text, or '(none)'.
     """
+    from agents import Runner, SQLiteSession
+
     prompt = (
         "あなたは会話支援のための下準備をします。今回はユーザーへの回答はしません。\n"
         "必要だと思ったときだけ retrieve_memories ツールを使って、関連する短期/長期メモリを取り出してください。\n"
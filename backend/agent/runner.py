@@ -3,7 +3,6 @@ from __future__ import annotations
 import os
 from typing import Generator, Optional
 
-from openai import OpenAI
 from ..config import get_client, model_name
 
 
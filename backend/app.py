@@ -3,12 +3,13 @@ from __future__ import annotations
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from .routes.chat import router as chat_router
 from .routes.memory import router as memory_router
 from .memory.manager import ensure_dirs
-from .memory.summarizer import daily_maintain
 from .config import init_env
+from . import startup
 
 
 def create_app() -> FastAPI:
@@ -26,18 +27,24 @@ def create_app() -> FastAPI:
     def _startup():
         init_env()
         ensure_dirs()
-        # Optional: run maintenance on startup if enabled
-        if os.getenv("MEMORY_MAINTAIN_ON_START", "0") in ("1", "true", "True"):
-            try:
-                daily_maintain()
-            except Exception:
-                # best-effort; ignore failures at startup
-                pass
+        # Agents SDK の読み込みと（有効なら）メンテはバックグラウンドで実行し、起動をブロックしない
+        startup.start_background_warmup()
 
     @app.get("/")
     def health():
         return {"ok": True, "model": os.getenv("OPENAI_MODEL", "gpt-5-mini")}
 
+    @app.get("/healthz")
+    def liveness():
+        """Liveness: the process is up and serving requests."""
+        return {"ok": True}
+
+    @app.get("/readyz")
+    def readiness():
+        """Readiness: background warm-up has finished; 503 until then."""
+        st = startup.status()
+        return JSONResponse(st, status_code=200 if st["ready"] else 503)
+
     app.include_router(chat_router)
     app.include_router(memory_router)
     return app
@@ -0,0 +1,88 @@
+"""Cold-start benchmark for the backend.
+
+Runs ``python -X importtime -c "import backend.app"`` in fresh interpreters and
+reports wall time plus the most expensive imports as JSON, so the numbers can be
+tracked over time.
+
+Usage:
+    python -m backend.bench_startup [--runs 5] [--top 15] [--module backend.app]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _parse_importtime(stderr: str) -> Dict[str, int]:
+    """Return {module: cumulative_us} from `-X importtime` output."""
+    out: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative = int(parts[1].strip())
+        except ValueError:
+            continue  # header line
+        out[parts[2].strip()] = cumulative
+    return out
+
+
+def _run_once(module: str) -> tuple[float, Dict[str, int]]:
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    return wall, _parse_importtime(proc.stderr)
+
+
+def main(argv: List[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--top", type=int, default=15)
+    ap.add_argument("--module", default="backend.app")
+    args = ap.parse_args(argv)
+
+    # 1回目は .pyc 生成を含むので計測から除外する
+    _run_once(args.module)
+    walls: List[float] = []
+    last: Dict[str, int] = {}
+    for _ in range(max(1, args.runs)):
+        wall, last = _run_once(args.module)
+        walls.append(wall)
+
+    heavy = [m for m in ("agents", "openai") if m in last]
+    top = sorted(last.items(), key=lambda kv: kv[1], reverse=True)[: args.top]
+    report = {
+        "module": args.module,
+        "python": sys.version.split()[0],
+        "runs": len(walls),
+        "wall_ms_median": round(statistics.median(walls) * 1000, 1),
+        "wall_ms_min": round(min(walls) * 1000, 1),
+        "import_ms": round(last.get(args.module, 0) / 1000, 1),
+        "heavy_modules_loaded": heavy,
+        "top_imports_ms": [{"module": m, "cumulative_ms": round(us / 1000, 1)} for m, us in top],
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
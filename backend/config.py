@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from dotenv import load_dotenv
-from openai import OpenAI
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 
 _ENV_LOADED = False
@@ -35,6 +37,9 @@ def get_client() -> Optional[OpenAI]:
     - If base URL is default (None) and no OPENAI_API_KEY, return None to indicate not configured.
     """
     init_env()
+    # openai は import が重いので、クライアントが実際に必要になった時点で読み込む
+    from openai import OpenAI
+
     api_key = os.getenv("OPENAI_API_KEY")
     url = base_url()
 
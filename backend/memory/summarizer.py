@@ -3,11 +3,13 @@ from __future__ import annotations
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
-from openai import OpenAI
 from ..config import get_client, model_name
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 from .manager import list_short_files_due, short_dir
 
 
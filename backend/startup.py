@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# 起動直後は重い依存（Agents SDK / openai）を読み込まずにリクエストを受け付け、
+# バックグラウンドのウォームアップ完了をもって readiness とする。
+_lock = threading.Lock()
+_state: Dict[str, Any] = {
+    "started_at": None,
+    "ready": False,
+    "warmup_seconds": None,
+    "warmup_error": None,
+    "maintenance": "disabled",
+    "maintenance_error": None,
+}
+_thread: Optional[threading.Thread] = None
+
+
+def _maintain_on_start() -> bool:
+    return os.getenv("MEMORY_MAINTAIN_ON_START", "0") in ("1", "true", "True")
+
+
+def _set(**kwargs: Any) -> None:
+    with _lock:
+        _state.update(kwargs)
+
+
+def _warm_up() -> None:
+    t0 = time.perf_counter()
+    try:
+        from .agent import character
+
+        character.warm_up()
+    except Exception as e:
+        # エージェントが読み込めない状態ではチャットも失敗するため、ready にはしない
+        logger.warning("warm-up failed", exc_info=True)
+        _set(warmup_error=str(e), warmup_seconds=round(time.perf_counter() - t0, 3))
+    else:
+        _set(ready=True, warmup_seconds=round(time.perf_counter() - t0, 3))
+
+    if _maintain_on_start():
+        _set(maintenance="running")
+        try:
+            from .memory.summarizer import daily_maintain
+
+            daily_maintain()
+            _set(maintenance="done")
+        except Exception as e:
+            # best-effort; record the failure but keep serving
+            logger.warning("startup maintenance failed", exc_info=True)
+            _set(maintenance="failed", maintenance_error=str(e))
+
+
+def start_background_warmup() -> None:
+    """Start the warm-up (and optional maintenance) in a daemon thread once per process."""
+    global _thread
+    with _lock:
+        if _thread is not None:
+            return
+        _state["started_at"] = time.time()
+        if _maintain_on_start():
+            _state["maintenance"] = "pending"
+        _thread = threading.Thread(target=_warm_up, name="memories-ai-warmup", daemon=True)
+    _thread.start()
+
+
+def status() -> Dict[str, Any]:
+    with _lock:
+        return dict(_state)